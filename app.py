@@ -1,20 +1,40 @@
 import os
-import json
-import time
+import re
+import sys
+import logging
+import logging.handlers
+import orjson
+import random
+import asyncio
+import hashlib
 import tweepy
 import argparse
 import requests
 import base64
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError, APIConnectionError, APITimeoutError
 from PIL import Image
-from pymongo import MongoClient
+from pymongo import MongoClient, InsertOne, WriteConcern
 from utils.storage_manager import CloudflareR2Storage, StorageUploadError
 
 load_dotenv()
 
+# Buffered message-only logging: per-tweet output accumulates in memory and
+# is flushed in blocks (or immediately on warnings/errors) instead of paying
+# a stdio write + flush per line
+_log_target = logging.StreamHandler(sys.stdout)
+_log_target.setFormatter(logging.Formatter("%(message)s"))
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=64, flushLevel=logging.WARNING, target=_log_target
+)
+logging.basicConfig(level=logging.INFO, handlers=[_log_buffer])
+logger = logging.getLogger(__name__)
+
 # API Credentials
 API_KEY = os.getenv("API_KEY")
 API_SECRET = os.getenv("API_SECRET")
@@ -29,6 +49,12 @@ MAX_TWEETS_PER_RUN = 10  # Basic tier: 5 deletes per 15 mins, analyze more than
 DELAY_BETWEEN_DELETES = 2
 PRE_2019_CUTOFF = datetime(2019, 1, 1, tzinfo=timezone.utc)
 SKIP_RECENT_DAYS = 3  # Skip tweets newer than this many days
+OPENAI_CONCURRENCY = 20  # Max concurrent OpenAI requests (respect RPM limits)
+AI_BATCH_SIZE = 15  # Text-only tweets analyzed per GPT request (rules prompt sent once)
+OPENAI_MAX_RETRIES = 6  # Attempts for transient OpenAI errors (429/timeouts)
+MAX_IMAGE_BYTES = 8 * 1024 * 1024  # Abort image downloads beyond this size
+MAX_MEDIA_BYTES = 64 * 1024 * 1024  # Abort video/media downloads beyond this size
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 # MongoDB Setup
 mongo_client = MongoClient(DATABASE_URL)
@@ -39,27 +65,67 @@ NODE_ENV = os.getenv("NODE_ENV", "production")
 collection_suffix = "-dev" if NODE_ENV == "development" else ""
 state_collection = db[f"state{collection_suffix}"]
 decisions_collection = db[f"decisions{collection_suffix}"]
+image_cache_collection = db[f"image_cache{collection_suffix}"]
+ai_cache_collection = db[f"ai_cache{collection_suffix}"]
 
 if NODE_ENV == "development":
-    print("⚠️  Development mode: Using -dev collections")
-
-# Initialize OpenAI
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
-
-
-class ContentAnalyzer:
-    """Analyzes tweet content using OpenAI GPT-4V"""
-
-    def __init__(self):
-        self.client = openai_client
-
-    def analyze_tweet(self, tweet_text, image_urls=None):
-        """
-        Analyze tweet text and images to determine if it should be deleted
-        Returns: {decision: DELETE/KEEP, confidence: float, reason: str, keywords: list}
-        """
-
-        prompt = f"""You are analyzing a tweet to determine if it should be deleted.
+    logger.warning("⚠️  Development mode: Using -dev collections")
+
+# Initialize OpenAI (async client so analyses can run concurrently)
+openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+# Shared HTTP session: nearly all downloads hit Twitter's CDN, so pooled
+# keep-alive connections skip a TCP+TLS handshake per image/video
+HTTP = requests.Session()
+HTTP.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504])
+))
+
+
+def download_capped(url, max_bytes, timeout=10):
+    """
+    Stream a URL into memory in chunks with a hard byte cap, so oversized
+    media is abandoned mid-download instead of fully buffered first.
+    Twitter media is already-compressed JPEG/MP4, so ask for an identity
+    encoding and skip pointless gzip.
+    Returns: (buf: BytesIO rewound to the start, content_type: str)
+             or (None, None) on failure
+    """
+    response = HTTP.get(url, stream=True, timeout=timeout,
+                        headers={"Accept-Encoding": "identity"})
+    if response.status_code != 200:
+        logger.warning(f"⚠️  Failed to download media: HTTP {response.status_code}")
+        return None, None
+
+    buf = BytesIO()
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        buf.write(chunk)
+        if buf.tell() > max_bytes:
+            logger.warning(f"⚠️  Download exceeded {max_bytes // (1024 * 1024)}MB cap, aborting: {url}")
+            response.close()
+            return None, None
+
+    buf.seek(0)
+    return buf, response.headers.get('Content-Type')
+
+
+# Fallback keyword tables, compiled once into a single-pass matcher so
+# _fallback_analysis scans the text once instead of once per keyword
+LOCATION_KEYWORDS = frozenset(['bali', 'indonesia', 'ubud', 'canggu', 'jakarta', 'seminyak'])
+WORK_KEYWORDS = frozenset(['work', 'build', 'ship', 'code', 'develop', 'launch',
+                           'craft', 'present', 'post', 'create', 'design', 'program'])
+KEYWORD_PATTERN = re.compile(
+    "|".join(sorted(LOCATION_KEYWORDS | WORK_KEYWORDS, key=len, reverse=True))
+)
+
+# Shared rule block for all analysis prompts. Sent as the system message so
+# the prefix is byte-identical across calls and OpenAI's automatic prompt
+# caching kicks in (cached input tokens bill at 50% with lower latency) -
+# embedding the tweet text in the same message defeated that.
+ANALYSIS_RULES = """You are analyzing tweets to determine if they should be deleted.
 
 DELETE if the tweet:
 - Mentions Bali, Indonesia, or any Indonesian cities/locations (Ubud, Canggu, Jakarta, etc.)
@@ -76,10 +142,41 @@ KEEP if the tweet:
 - Is purely personal (food, travel without work context, social activities)
 - Mentions other locations (not Indonesia/Bali)
 - Contains no work indicators
-- Is about hobbies, entertainment, or leisure
+- Is about hobbies, entertainment, or leisure"""
+
 
-Tweet text: "{tweet_text}"
-Number of images: {len(image_urls) if image_urls else 0}
+class ContentAnalyzer:
+    """Analyzes tweet content using OpenAI GPT-4V"""
+
+    RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError)
+
+    def __init__(self):
+        self.client = openai_client
+        self.semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
+        # Cached image payloads expire after a week. Created here rather than
+        # at module scope so importing app.py stays free of MongoDB I/O
+        image_cache_collection.create_index("created_at", expireAfterSeconds=7 * 86400)
+
+    async def _create_completion(self, **kwargs):
+        """
+        Call chat.completions.create with bounded exponential backoff so a
+        transient 429/timeout doesn't immediately degrade to keyword fallback
+        """
+        for attempt in range(OPENAI_MAX_RETRIES):
+            try:
+                async with self.semaphore:
+                    return await self.client.chat.completions.create(**kwargs)
+            except self.RETRYABLE_ERRORS as e:
+                if attempt == OPENAI_MAX_RETRIES - 1:
+                    raise
+                delay = min(60.0, (2 ** attempt) * random.uniform(1.0, 2.0))
+                logger.warning(f"⏳ OpenAI {type(e).__name__}, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
+    def _build_user_prompt(self, tweet_text, image_count):
+        """Build the dynamic single-tweet tail (the rules go in the system message)"""
+        return f"""Tweet text: "{tweet_text}"
+Number of images: {image_count}
 
 Analyze carefully and respond in JSON format:
 {{
@@ -89,70 +186,236 @@ Analyze carefully and respond in JSON format:
   "detected_keywords": ["keyword1", "keyword2"]
 }}"""
 
+    async def analyze_tweet(self, tweet_text, image_urls=None):
+        """
+        Analyze tweet text and images to determine if it should be deleted
+        Returns: {decision: DELETE/KEEP, confidence: float, reason: str, keywords: list}
+        """
+
+        # Reruns of the same tweet (retries, reset pagination) hit the cache
+        # instead of paying for another GPT call
+        cache_key = hashlib.sha256(
+            orjson.dumps([tweet_text, sorted(image_urls or [])])
+        ).hexdigest()
+        # pymongo is synchronous, so the cache round-trips run in worker
+        # threads to keep the gathered analyses from blocking the event loop
+        cached = await asyncio.to_thread(ai_cache_collection.find_one, {"_id": cache_key})
+        if cached:
+            return cached["result"]
+
+        prompt = self._build_user_prompt(tweet_text, len(image_urls) if image_urls else 0)
+
         try:
-            messages = [{"role": "user", "content": [{"type": "text", "text": prompt}]}]
+            messages = [
+                {"role": "system", "content": ANALYSIS_RULES},
+                {"role": "user", "content": [{"type": "text", "text": prompt}]}
+            ]
 
-            # Add images if present
+            # Add images if present (downloads are independent, so run them
+            # in worker threads concurrently instead of one after another)
             if image_urls:
-                for img_url in image_urls[:4]:  # Max 4 images
-                    try:
-                        # Download and encode image
-                        response = requests.get(img_url, timeout=10)
-                        if response.status_code == 200:
-                            img = Image.open(BytesIO(response.content))
-                            # Resize if too large (max 2000x2000)
-                            if img.width > 2000 or img.height > 2000:
-                                img.thumbnail((2000, 2000))
-
-                            # Convert to base64
-                            buffered = BytesIO()
-                            img.save(buffered, format="PNG")
-                            img_base64 = base64.b64encode(buffered.getvalue()).decode()
-
-                            messages[0]["content"].append({
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{img_base64}"
-                                }
-                            })
-                    except Exception as e:
-                        print(f"⚠️  Failed to download image {img_url}: {e}")
-
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
+                encoded = await asyncio.gather(
+                    *(asyncio.to_thread(self._get_image_data_url, url) for url in image_urls[:4]),
+                    return_exceptions=True
+                )
+                for img_url, data_url in zip(image_urls[:4], encoded):
+                    if isinstance(data_url, Exception):
+                        logger.warning(f"⚠️  Failed to download image {img_url}: {data_url}")
+                    elif data_url:
+                        messages[1]["content"].append({
+                            "type": "image_url",
+                            "image_url": {
+                                "url": data_url
+                            }
+                        })
+
+            # Call OpenAI API (retried with backoff, bounded by the semaphore)
+            response = await self._create_completion(
                 model="gpt-4o-mini",  # Cost-effective model
                 messages=messages,
                 response_format={"type": "json_object"},
                 max_tokens=500
             )
 
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
+            await asyncio.to_thread(
+                ai_cache_collection.replace_one,
+                {"_id": cache_key},
+                {"_id": cache_key, "result": result, "created_at": datetime.now(timezone.utc)},
+                upsert=True
+            )
             return result
 
         except Exception as e:
-            print(f"❌ OpenAI API error: {e}")
+            logger.error(f"❌ OpenAI API error: {e}")
             # Fallback to keyword-based detection
             return self._fallback_analysis(tweet_text)
 
-    def _fallback_analysis(self, text):
-        """Fallback keyword-based analysis if OpenAI fails"""
-        text_lower = text.lower()
+    def _get_image_data_url(self, img_url):
+        """
+        Download an image and turn it into a base64 data URL, caching the
+        result in MongoDB keyed by URL hash so re-analyses skip the download
+        Returns: data URL string or None if the download failed
+        """
+        url_hash = hashlib.sha256(img_url.encode()).hexdigest()
 
-        # Check for Bali/Indonesia mentions
-        location_keywords = ['bali', 'indonesia', 'ubud', 'canggu', 'jakarta', 'seminyak']
-        has_location = any(kw in text_lower for kw in location_keywords)
+        cached = image_cache_collection.find_one({"_id": url_hash})
+        if cached and cached.get("data_url"):
+            return cached["data_url"]
 
-        # Check for work mentions
-        work_keywords = ['work', 'build', 'ship', 'code', 'develop', 'launch',
-                         'craft', 'present', 'post', 'create', 'design', 'program']
-        has_work = any(kw in text_lower for kw in work_keywords)
+        buf, header_type = download_capped(img_url, MAX_IMAGE_BYTES)
+        if buf is None:
+            return None
 
-        if has_location or has_work:
+        img = Image.open(buf)
+        if img.width <= 2000 and img.height <= 2000:
+            # Small enough already - pass the original (usually JPEG) bytes
+            # through untouched instead of re-encoding them as PNG
+            content_type = header_type or 'image/jpeg'
+            img_base64 = base64.b64encode(buf.getvalue()).decode()
+        else:
+            # Only here do we pay for a PIL decode/resize/encode round-trip
+            img.thumbnail((2000, 2000))
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            buffered = BytesIO()
+            img.save(buffered, format="JPEG", quality=85)
+            content_type = 'image/jpeg'
+            img_base64 = base64.b64encode(buffered.getvalue()).decode()
+
+        data_url = f"data:{content_type};base64,{img_base64}"
+        image_cache_collection.replace_one(
+            {"_id": url_hash},
+            {"_id": url_hash, "data_url": data_url, "created_at": datetime.now(timezone.utc)},
+            upsert=True
+        )
+        return data_url
+
+    async def analyze_tweets_batch(self, tweet_texts):
+        """
+        Analyze several text-only tweets in a single GPT request.
+        The rules prompt is sent once instead of once per tweet, cutting
+        both prompt tokens and request count.
+        Returns: list of analysis dicts, one per tweet, in input order
+        """
+        numbered_tweets = "\n".join(f'[{i}] "{text}"' for i, text in enumerate(tweet_texts))
+
+        prompt = f"""Analyze each of the following tweets (none have images):
+{numbered_tweets}
+
+Analyze carefully and respond in JSON format:
+{{
+  "results": [
+    {{
+      "index": 0,
+      "decision": "DELETE" or "KEEP",
+      "confidence": 0.0-1.0,
+      "reason": "brief explanation",
+      "detected_keywords": ["keyword1", "keyword2"]
+    }}
+  ]
+}}
+Include one entry per tweet, keyed by its [index]."""
+
+        try:
+            response = await self._create_completion(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": ANALYSIS_RULES},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=150 * len(tweet_texts) + 100
+            )
+
+            parsed = orjson.loads(response.choices[0].message.content)
+            by_index = {r["index"]: r for r in parsed["results"] if "decision" in r}
+            # Any tweet GPT skipped falls back to keyword analysis
+            return [by_index.get(i, self._fallback_analysis(text))
+                    for i, text in enumerate(tweet_texts)]
+
+        except Exception as e:
+            logger.error(f"❌ OpenAI batch API error: {e}")
+            return [self._fallback_analysis(text) for text in tweet_texts]
+
+    async def submit_batch(self, tweets):
+        """
+        Submit text-only tweets to the OpenAI Batch API (50% token cost,
+        separate rate-limit pool, results within 24h).
+        tweets: list of (tweet_id, text) tuples
+        Returns: batch id to poll on a later run
+        """
+        lines = []
+        for tweet_id, text in tweets:
+            lines.append(orjson.dumps({
+                "custom_id": str(tweet_id),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o-mini",
+                    "messages": [
+                        {"role": "system", "content": ANALYSIS_RULES},
+                        {"role": "user", "content": self._build_user_prompt(text, 0)}
+                    ],
+                    "response_format": {"type": "json_object"},
+                    "max_tokens": 500
+                }
+            }))
+
+        batch_file = await self.client.files.create(
+            file=("tweet_analysis.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    async def retrieve_batch_results(self, batch_id):
+        """
+        Poll a previously submitted batch.
+        Returns: dict of tweet_id -> analysis dict when completed,
+                 {} if the batch failed/expired, None while still running
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+
+        if batch.status in ("failed", "expired", "cancelled"):
+            logger.error(f"❌ OpenAI batch {batch_id} ended with status: {batch.status}")
+            return {}
+
+        if batch.status != "completed":
+            logger.warning(f"⏳ OpenAI batch {batch_id} still {batch.status} - try again later")
+            return None
+
+        content = await self.client.files.content(batch.output_file_id)
+
+        results = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            try:
+                body = item["response"]["body"]
+                results[item["custom_id"]] = orjson.loads(body["choices"][0]["message"]["content"])
+            except (KeyError, TypeError, orjson.JSONDecodeError):
+                # Leave missing entries to the caller's fallback
+                continue
+        return results
+
+    def _fallback_analysis(self, text):
+        """Fallback keyword-based analysis if OpenAI fails"""
+        # One scan of the text finds every location/work keyword at once
+        hits = KEYWORD_PATTERN.findall(text.lower())
+
+        if hits:
+            has_location = any(kw in LOCATION_KEYWORDS for kw in hits)
             return {
                 "decision": "DELETE",
                 "confidence": 0.8,
                 "reason": f"Keyword match: {'location' if has_location else 'work'}",
-                "detected_keywords": [kw for kw in (location_keywords + work_keywords) if kw in text_lower]
+                "detected_keywords": list(dict.fromkeys(hits))
             }
 
         return {
@@ -167,8 +430,21 @@ class StateManager:
     """Manages state and decision logging using MongoDB"""
 
     def __init__(self):
-        self.state_collection = state_collection
-        self.decisions_collection = decisions_collection
+        # State is rewritten every run and rebuildable - no need to wait on
+        # a journal fsync for it either
+        self.state_collection = state_collection.with_options(
+            write_concern=WriteConcern(w=1, j=False)
+        )
+        # Decisions are an append-only log - a single-node ack without
+        # journal fsync is plenty for them
+        self.decisions_collection = decisions_collection.with_options(
+            write_concern=WriteConcern(w=1, j=False)
+        )
+        # Keeps the preload $in query an index scan (and guards against double-logging)
+        self.decisions_collection.create_index("tweet_id", unique=True)
+        # check_mongodb.py sorts recent decisions by analyzed_at
+        self.decisions_collection.create_index([("analyzed_at", -1)])
+        self._pending_decisions = []
         self.state = self.load_state()
 
     def load_state(self):
@@ -199,27 +475,34 @@ class StateManager:
         """Update pagination token in state"""
         self.state["pagination_token"] = token
 
-    def log_decision(self, tweet, decision, reason, ai_analysis, deleted=False, media_uploads=None):
-        """Log a decision to MongoDB"""
+    def log_decision(self, tweet, decision, reason, ai_analysis, deleted=False, media_uploads=None, now=None):
+        """Log a decision to MongoDB (now: reusable timestamp for the run)"""
+        if now is None:
+            now = datetime.now(timezone.utc)
         decision_doc = {
             "tweet_id": str(tweet.id),
-            "text": tweet.full_text[:200],  # Truncate long tweets
+            "text": tweet.full_text if len(tweet.full_text) <= 200 else tweet.full_text[:200],
             "created_at": tweet.created_at.isoformat(),
             "decision": decision,
             "reason": reason,
             "ai_analysis": ai_analysis,
-            "has_images": bool(hasattr(tweet, 'entities') and 'media' in tweet.entities),
+            "has_images": 'media' in (getattr(tweet, 'entities', None) or {}),
             "has_video": self._has_video(tweet),
             "is_reply": bool(tweet.in_reply_to_status_id),
-            "is_retweet": hasattr(tweet, 'retweeted_status'),
+            "is_retweet": bool(getattr(tweet, 'retweeted_status', False)),
             "deleted": deleted,
-            "deleted_at": datetime.now().isoformat() if deleted else None,
-            "analyzed_at": datetime.now().isoformat(),
+            "deleted_at": now.isoformat() if deleted else None,
+            "analyzed_at": now.isoformat(),
             "media_uploads": media_uploads or []
         }
 
-        # Insert decision into MongoDB
-        self.decisions_collection.insert_one(decision_doc)
+        # Buffer the decision - flush() writes the whole run in one bulk_write
+        self._pending_decisions.append(InsertOne(decision_doc))
+
+        # Track the newest analyzed tweet so fresh passes can use since_id
+        last_id = self.state.get("last_analyzed_tweet_id")
+        if last_id is None or int(tweet.id) > int(last_id):
+            self.state["last_analyzed_tweet_id"] = str(tweet.id)
 
         # Update stats in state
         self.state["total_analyzed"] += 1
@@ -230,15 +513,30 @@ class StateManager:
 
     def _has_video(self, tweet):
         """Check if tweet has video"""
-        if hasattr(tweet, 'extended_entities') and 'media' in tweet.extended_entities:
-            for media in tweet.extended_entities['media']:
+        extended_entities = getattr(tweet, 'extended_entities', None)
+        if extended_entities and 'media' in extended_entities:
+            for media in extended_entities['media']:
                 if media['type'] in ['video', 'animated_gif']:
                     return True
         return False
 
-    def was_analyzed(self, tweet_id):
-        """Check if tweet was already analyzed in MongoDB"""
-        return self.decisions_collection.find_one({"tweet_id": str(tweet_id)}) is not None
+    def flush(self):
+        """Write all buffered decisions in one bulk_write, then save state"""
+        if self._pending_decisions:
+            self.decisions_collection.bulk_write(self._pending_decisions, ordered=False)
+            self._pending_decisions = []
+        self.save_state()
+
+    def preload_analyzed(self, tweet_ids):
+        """
+        Fetch which of the given tweet ids were already analyzed, in a single
+        $in query (one round-trip instead of one find_one per tweet)
+        Returns: set of tweet id strings
+        """
+        ids = [str(tweet_id) for tweet_id in tweet_ids]
+        return {doc["tweet_id"] for doc in self.decisions_collection.find(
+            {"tweet_id": {"$in": ids}}, {"tweet_id": 1}
+        )}
 
 
 class DeletionDecider:
@@ -248,10 +546,11 @@ class DeletionDecider:
         self.analyzer = analyzer
         self.my_user_id = my_user_id
 
-    def should_delete(self, tweet):
+    def rule_check(self, tweet):
         """
-        Determine if tweet should be deleted
-        Returns: (should_delete: bool, reason: str, ai_analysis: dict)
+        Apply the cheap rule-based checks (no AI call)
+        Returns: (should_delete: bool, reason: str, ai_analysis: dict) or None
+                 if no rule matched and AI analysis is needed
         """
 
         # Rule 1: Pre-2019 tweets - auto delete
@@ -267,75 +566,137 @@ class DeletionDecider:
             return True, "Reply to another user (auto-delete)", {"decision": "DELETE", "confidence": 1.0}
 
         # Rule 4: Retweets - auto delete
-        if hasattr(tweet, 'retweeted_status'):
+        if getattr(tweet, 'retweeted_status', False):
             return True, "Retweet (auto-delete)", {"decision": "DELETE", "confidence": 1.0}
 
-        # Rule 5: AI Analysis for original tweets and self-replies
-        image_urls = self._extract_image_urls(tweet)
-        ai_analysis = self.analyzer.analyze_tweet(tweet.full_text, image_urls)
+        # No rule matched - needs AI analysis
+        return None
 
+    def decide_from_analysis(self, ai_analysis):
+        """
+        Turn an AI analysis dict into a deletion decision
+        Returns: (should_delete: bool, reason: str, ai_analysis: dict)
+        """
         # Delete if confidence >= 0.5 and decision is DELETE
         if ai_analysis['decision'] == 'DELETE' and ai_analysis['confidence'] >= 0.5:
             return True, f"AI: {ai_analysis['reason']}", ai_analysis
 
         return False, f"AI: {ai_analysis['reason']}", ai_analysis
 
+    def _media_summary(self, tweet):
+        """
+        Walk the tweet's media once and build everything the other helpers
+        need, caching the result on the tweet (the old helpers each
+        re-traversed extended_entities 3-4 times per tweet)
+        Returns: {photo_urls, video_urls, media_items, has_video}
+        """
+        summary = getattr(tweet, 'media_summary', None)
+        if summary is not None:
+            return summary
+
+        summary = {"photo_urls": [], "video_urls": [], "media_items": [], "has_video": False}
+        extended_entities = getattr(tweet, 'extended_entities', None)
+        if extended_entities and 'media' in extended_entities:
+            for media in extended_entities['media']:
+                if media['type'] == 'photo':
+                    summary["photo_urls"].append(media['media_url_https'])
+                    summary["media_items"].append({
+                        'type': 'photo',
+                        'url': media['media_url_https']
+                    })
+                elif media['type'] in ['video', 'animated_gif']:
+                    summary["has_video"] = True
+                    # Get highest quality video variant
+                    if 'video_info' in media and 'variants' in media['video_info']:
+                        # Filter for mp4 variants and pick the highest bitrate
+                        mp4_variants = [v for v in media['video_info']['variants'] if v.get('content_type') == 'video/mp4']
+                        if mp4_variants:
+                            best_variant = max(mp4_variants, key=lambda v: v.get('bitrate', 0))
+                            summary["video_urls"].append(best_variant['url'])
+                            summary["media_items"].append({
+                                'type': 'video',
+                                'url': best_variant['url']
+                            })
+
+        try:
+            tweet.media_summary = summary
+        except AttributeError:
+            pass  # Raw v1 tweets have no slot for the cache
+        return summary
+
     def _has_video(self, tweet):
         """Check if tweet has video"""
-        if hasattr(tweet, 'extended_entities') and 'media' in tweet.extended_entities:
-            for media in tweet.extended_entities['media']:
-                if media['type'] in ['video', 'animated_gif']:
-                    return True
-        return False
+        return self._media_summary(tweet)["has_video"]
 
     def _extract_image_urls(self, tweet):
         """Extract image URLs from tweet"""
-        image_urls = []
-        if hasattr(tweet, 'extended_entities') and 'media' in tweet.extended_entities:
-            for media in tweet.extended_entities['media']:
-                if media['type'] == 'photo':
-                    image_urls.append(media['media_url_https'])
-        return image_urls
+        return self._media_summary(tweet)["photo_urls"]
 
     def _extract_video_urls(self, tweet):
         """Extract video URLs from tweet"""
-        video_urls = []
-        if hasattr(tweet, 'extended_entities') and 'media' in tweet.extended_entities:
-            for media in tweet.extended_entities['media']:
-                if media['type'] in ['video', 'animated_gif']:
-                    # Get highest quality video variant
-                    if 'video_info' in media and 'variants' in media['video_info']:
-                        # Filter for mp4 variants and sort by bitrate
-                        mp4_variants = [v for v in media['video_info']['variants'] if v.get('content_type') == 'video/mp4']
-                        if mp4_variants:
-                            # Sort by bitrate (highest first)
-                            best_variant = max(mp4_variants, key=lambda v: v.get('bitrate', 0))
-                            video_urls.append(best_variant['url'])
-        return video_urls
+        return self._media_summary(tweet)["video_urls"]
 
     def _extract_all_media(self, tweet):
         """
         Extract all media (images and videos) from tweet
         Returns: list of dicts with {type: 'photo'|'video', url: str}
         """
-        media_items = []
-        if hasattr(tweet, 'extended_entities') and 'media' in tweet.extended_entities:
-            for media in tweet.extended_entities['media']:
-                if media['type'] == 'photo':
-                    media_items.append({
-                        'type': 'photo',
-                        'url': media['media_url_https']
+        return self._media_summary(tweet)["media_items"]
+
+
+class AdaptedTweet:
+    """v1-like view of a v2 tweet, so the rule/media helpers work unchanged"""
+
+    __slots__ = ("id", "full_text", "created_at", "in_reply_to_status_id",
+                 "in_reply_to_user_id", "retweeted_status", "extended_entities",
+                 "media_summary")
+
+    def __init__(self, v2_tweet, media_dict):
+        self.id = v2_tweet.id
+        self.full_text = v2_tweet.text
+        self.created_at = v2_tweet.created_at
+        self.in_reply_to_status_id = None
+        self.in_reply_to_user_id = getattr(v2_tweet, 'in_reply_to_user_id', None)
+        self.retweeted_status = False
+        self.media_summary = None  # Filled lazily by DeletionDecider
+
+        # Check for retweet
+        if getattr(v2_tweet, 'referenced_tweets', None):
+            for ref in v2_tweet.referenced_tweets:
+                if ref.type == 'retweeted':
+                    self.retweeted_status = True
+                    break
+                elif ref.type == 'replied_to':
+                    self.in_reply_to_status_id = ref.id
+
+        # Handle media
+        self.extended_entities = {}
+        attachments = getattr(v2_tweet, 'attachments', None)
+        if attachments and 'media_keys' in attachments:
+            media_list = []
+            for media_key in attachments['media_keys']:
+                if media_key in media_dict:
+                    media_obj = media_dict[media_key]
+                    media_list.append({
+                        'type': media_obj.type,
+                        'media_url_https': getattr(media_obj, 'url', None)
                     })
-                elif media['type'] in ['video', 'animated_gif']:
-                    if 'video_info' in media and 'variants' in media['video_info']:
-                        mp4_variants = [v for v in media['video_info']['variants'] if v.get('content_type') == 'video/mp4']
-                        if mp4_variants:
-                            best_variant = max(mp4_variants, key=lambda v: v.get('bitrate', 0))
-                            media_items.append({
-                                'type': 'video',
-                                'url': best_variant['url']
-                            })
-        return media_items
+            if media_list:
+                self.extended_entities['media'] = media_list
+
+
+class BatchTweetRecord:
+    """Lightweight stand-in for an adapted tweet when logging batch-mode decisions"""
+
+    def __init__(self, doc):
+        self.id = doc["tweet_id"]
+        self.full_text = doc["text"]
+        self.created_at = datetime.fromisoformat(doc["created_at"])
+        self.in_reply_to_status_id = None
+        self.in_reply_to_user_id = None
+        self.retweeted_status = False
+        self.extended_entities = {}
+        self.media_summary = None
 
 
 class TweetDeleter:
@@ -375,55 +736,122 @@ class TweetDeleter:
         self.storage = None
         try:
             self.storage = CloudflareR2Storage()
-            print(f"✅ Cloudflare R2 storage initialized")
+            logger.info(f"✅ Cloudflare R2 storage initialized")
         except (ValueError, Exception) as e:
-            print(f"⚠️  Cloudflare R2 not configured: {e}")
-            print(f"   Media will not be uploaded. Set CLOUDFLARE_* env vars to enable.")
-
-    def run(self, limit=MAX_TWEETS_PER_RUN):
-        """Main execution loop"""
-        print("="*60)
-        print(f"🧹 Selective Tweet Deleter for @{self.username}")
-        print(f"   Mode: {'DRY RUN (no deletions)' if self.dry_run else 'EXECUTE (will delete)'}")
-        print("="*60)
-        print(f"\n📊 Stats so far:")
-        print(f"   Analyzed: {self.state_manager.state['total_analyzed']}")
-        print(f"   Deleted: {self.state_manager.state['total_deleted']}")
-        print(f"   Kept: {self.state_manager.state['total_kept']}")
-
-        # Get pagination token from state
+            logger.warning(f"⚠️  Cloudflare R2 not configured: {e}")
+            logger.info(f"   Media will not be uploaded. Set CLOUDFLARE_* env vars to enable.")
+
+    def _print_header(self):
+        """Print the run banner and lifetime stats"""
+        logger.info("="*60)
+        logger.info(f"🧹 Selective Tweet Deleter for @{self.username}")
+        logger.info(f"   Mode: {'DRY RUN (no deletions)' if self.dry_run else 'EXECUTE (will delete)'}")
+        logger.info("="*60)
+        logger.info(f"\n📊 Stats so far:")
+        logger.info(f"   Analyzed: {self.state_manager.state['total_analyzed']}")
+        logger.info(f"   Deleted: {self.state_manager.state['total_deleted']}")
+        logger.info(f"   Kept: {self.state_manager.state['total_kept']}")
+
+    def _fetch_tweets(self, limit):
+        """Fetch the next page of tweets from the v2 API (honours saved pagination)"""
         pagination_token = self.state_manager.state.get("pagination_token")
 
         if pagination_token:
-            print(f"\n📥 Fetching up to {limit} tweets (continuing from previous run)...")
+            logger.info(f"\n📥 Fetching up to {limit} tweets (continuing from previous run)...")
         else:
-            print(f"\n📥 Fetching up to {limit} tweets (starting from newest)...")
+            logger.info(f"\n📥 Fetching up to {limit} tweets (starting from newest)...")
+
+        # Fetch tweets using v2 API with pagination
+        # v2 API requires min 5, max 100 results per request
+        max_results = max(5, min(limit, 100))
+
+        # Build request parameters
+        request_params = {
+            "id": self.my_user_id,
+            "max_results": max_results,
+            "tweet_fields": ['created_at', 'text', 'attachments', 'referenced_tweets', 'in_reply_to_user_id'],
+            "expansions": ['attachments.media_keys'],
+            "media_fields": ['type', 'url', 'preview_image_url']
+        }
 
-        try:
-            # Fetch tweets using v2 API with pagination
-            # v2 API requires min 5, max 100 results per request
-            max_results = max(5, min(limit, 100))
-
-            # Build request parameters
-            request_params = {
-                "id": self.my_user_id,
-                "max_results": max_results,
-                "tweet_fields": ['created_at', 'text', 'attachments', 'referenced_tweets', 'in_reply_to_user_id'],
-                "expansions": ['attachments.media_keys'],
-                "media_fields": ['type', 'url', 'preview_image_url']
-            }
+        # Let Twitter filter server-side instead of fetching tweets we would
+        # only skip: nothing newer than the recency cutoff, and on a fresh
+        # pass nothing older than the newest tweet we already analyzed.
+        # Passed as a datetime so tweepy formats it the way the API documents
+        request_params["end_time"] = (
+            datetime.now(timezone.utc) - timedelta(days=SKIP_RECENT_DAYS)
+        )
+
+        # Add pagination token if we have one
+        if pagination_token:
+            request_params["pagination_token"] = pagination_token
+        else:
+            last_analyzed_id = self.state_manager.state.get("last_analyzed_tweet_id")
+            if last_analyzed_id:
+                request_params["since_id"] = last_analyzed_id
+
+        return self.client.get_users_tweets(**request_params)
+
+    def _update_pagination(self, response):
+        """Save (or reset) the pagination token for the next run"""
+        if response.meta and 'next_token' in response.meta:
+            self.state_manager.update_pagination_token(response.meta['next_token'])
+            logger.info(f"\n📄 Pagination token saved - will continue from here next run")
+        else:
+            # No more pages, reset token
+            self.state_manager.update_pagination_token(None)
+            logger.info(f"\n🏁 Reached end of tweets - will start from newest on next run")
+
+    async def _apply_decision(self, tweet_adapted, should_delete, reason, ai_analysis, uploaded_media, now=None):
+        """
+        Execute (or dry-run) and log one decided tweet
+        Returns: (decision: str, actually_deleted: bool)
+        """
+        tweet_preview = tweet_adapted.full_text[:60].replace('\n', ' ')
+        date_str = tweet_adapted.created_at.strftime("%Y-%m-%d")
+
+        if should_delete:
+            decision_emoji = "🗑️ "
 
-            # Add pagination token if we have one
-            if pagination_token:
-                request_params["pagination_token"] = pagination_token
+            # Actually delete if not dry run
+            actually_deleted = False
+            if not self.dry_run:
+                try:
+                    self.api.destroy_status(tweet_adapted.id)
+                    actually_deleted = True
+                    logger.info("%s DELETED [%s]: %s...", decision_emoji, date_str, tweet_preview)
+                    logger.info("   Reason: %s", reason)
+                    await asyncio.sleep(DELAY_BETWEEN_DELETES)
+                except tweepy.errors.TweepyException as e:
+                    logger.error(f"❌ Failed to delete: {e}")
+            else:
+                logger.info("%s WOULD DELETE [%s]: %s...", decision_emoji, date_str, tweet_preview)
+                logger.info("   Reason: %s", reason)
+
+            self.state_manager.log_decision(
+                tweet_adapted, "DELETE", reason, ai_analysis, actually_deleted, uploaded_media, now=now
+            )
+            return "DELETE", actually_deleted
 
-            response = self.client.get_users_tweets(**request_params)
+        logger.info("✅ KEEPING [%s]: %s...", date_str, tweet_preview)
+        logger.info("   Reason: %s", reason)
+
+        self.state_manager.log_decision(
+            tweet_adapted, "KEEP", reason, ai_analysis, False, uploaded_media, now=now
+        )
+        return "KEEP", False
+
+    async def run(self, limit=MAX_TWEETS_PER_RUN):
+        """Main execution loop"""
+        self._print_header()
+
+        try:
+            response = self._fetch_tweets(limit)
 
             if not response.data:
-                print("✅ No more tweets to process!")
+                logger.info("✅ No more tweets to process!")
                 # Reset pagination token since we've reached the end
                 self.state_manager.update_pagination_token(None)
-                self.state_manager.save_state()
                 return
 
             tweets = response.data
@@ -431,22 +859,27 @@ class TweetDeleter:
             if response.includes and 'media' in response.includes:
                 media_dict = {m.media_key: m for m in response.includes['media']}
 
-            print(f"📋 Found {len(tweets)} tweets to analyze\n")
+            logger.info(f"📋 Found {len(tweets)} tweets to analyze\n")
 
             analyzed_count = 0
             deleted_count = 0
             kept_count = 0
 
+            # Phase 1: filter, adapt, and back up media for each candidate tweet
+            # (one clock read serves every tweet in this run)
+            now_utc = datetime.now(timezone.utc)
+            analyzed_ids = self.state_manager.preload_analyzed(tweet.id for tweet in tweets)
+            pending = []
             for tweet in tweets:
                 # Skip if already analyzed
-                if self.state_manager.was_analyzed(tweet.id):
-                    print(f"⏭️  Skipping already analyzed tweet {tweet.id}")
+                if str(tweet.id) in analyzed_ids:
+                    logger.info("⏭️  Skipping already analyzed tweet %s", tweet.id)
                     continue
 
                 # Skip tweets that are too recent
-                tweet_age = datetime.now(timezone.utc) - tweet.created_at
+                tweet_age = now_utc - tweet.created_at
                 if tweet_age.days < SKIP_RECENT_DAYS:
-                    print(f"⏭️  Skipping recent tweet {tweet.id} ({tweet_age.days} days old, waiting {SKIP_RECENT_DAYS} days)")
+                    logger.info("⏭️  Skipping recent tweet %s (%s days old, waiting %s days)", tweet.id, tweet_age.days, SKIP_RECENT_DAYS)
                     continue
 
                 analyzed_count += 1
@@ -454,6 +887,10 @@ class TweetDeleter:
                 # Adapt v2 tweet to v1-like structure for compatibility
                 tweet_adapted = self._adapt_v2_tweet(tweet, media_dict)
 
+                # Rules first: a rule-driven DELETE means no AI call and no
+                # image fetching later - only the R2 backup still happens
+                rule_decision = self.decider.rule_check(tweet_adapted)
+
                 # Extract and upload media (skip replies to other people)
                 uploaded_media = []
                 is_reply_to_other = tweet_adapted.in_reply_to_status_id and tweet_adapted.in_reply_to_user_id != self.my_user_id
@@ -461,126 +898,228 @@ class TweetDeleter:
                 if not is_reply_to_other:
                     media_items = self.decider._extract_all_media(tweet_adapted)
                     if media_items:
-                        print(f"📸 Found {len(media_items)} media item(s) in tweet {tweet.id}")
+                        logger.info("📸 Found %s media item(s) in tweet %s", len(media_items), tweet.id)
                         uploaded_media = self._upload_tweet_media(tweet_adapted, media_items)
                     else:
-                        print(f"⏭️  No media found in tweet {tweet.id} - skipping backup")
+                        logger.info("⏭️  No media found in tweet %s - skipping backup", tweet.id)
 
-                # Make decision
-                should_delete, reason, ai_analysis = self.decider.should_delete(tweet_adapted)
+                pending.append((tweet, tweet_adapted, uploaded_media, rule_decision))
 
-                tweet_preview = tweet.text[:60].replace('\n', ' ')
-                date_str = tweet.created_at.strftime("%Y-%m-%d")
+            # Phase 2: decide. Rules are free; tweets with images need one vision
+            # request each; text-only tweets are batched AI_BATCH_SIZE per prompt.
+            decisions = [None] * len(pending)
+            with_images = []  # (index, full_text, image_urls)
+            text_only = []    # (index, full_text)
 
-                if should_delete:
-                    deleted_count += 1
-                    decision_emoji = "🗑️ "
-
-                    # Actually delete if not dry run
-                    actually_deleted = False
-                    if not self.dry_run:
-                        try:
-                            self.api.destroy_status(tweet.id)
-                            actually_deleted = True
-                            print(f"{decision_emoji} DELETED [{date_str}]: {tweet_preview}...")
-                            print(f"   Reason: {reason}")
-                            time.sleep(DELAY_BETWEEN_DELETES)
-                        except tweepy.errors.TweepyException as e:
-                            print(f"❌ Failed to delete: {e}")
-                    else:
-                        print(f"{decision_emoji} WOULD DELETE [{date_str}]: {tweet_preview}...")
-                        print(f"   Reason: {reason}")
+            for i, (_, tweet_adapted, _, rule_decision) in enumerate(pending):
+                if rule_decision:
+                    decisions[i] = rule_decision
+                    continue
 
-                    self.state_manager.log_decision(
-                        tweet_adapted, "DELETE", reason, ai_analysis, actually_deleted, uploaded_media
-                    )
+                image_urls = self.decider._extract_image_urls(tweet_adapted)
+                if image_urls:
+                    with_images.append((i, tweet_adapted.full_text, image_urls))
                 else:
-                    kept_count += 1
-                    print(f"✅ KEEPING [{date_str}]: {tweet_preview}...")
-                    print(f"   Reason: {reason}")
+                    text_only.append((i, tweet_adapted.full_text))
+
+            batches = [text_only[start:start + AI_BATCH_SIZE]
+                       for start in range(0, len(text_only), AI_BATCH_SIZE)]
+
+            # All vision requests and text batches run concurrently
+            analysis_results = await asyncio.gather(
+                *(self.analyzer.analyze_tweet(text, urls) for _, text, urls in with_images),
+                *(self.analyzer.analyze_tweets_batch([text for _, text in batch]) for batch in batches)
+            )
+
+            for (i, _, _), analysis in zip(with_images, analysis_results):
+                decisions[i] = self.decider.decide_from_analysis(analysis)
+
+            for batch, batch_results in zip(batches, analysis_results[len(with_images):]):
+                for (i, _), analysis in zip(batch, batch_results):
+                    decisions[i] = self.decider.decide_from_analysis(analysis)
 
-                    self.state_manager.log_decision(
-                        tweet_adapted, "KEEP", reason, ai_analysis, False, uploaded_media
-                    )
+            # Phase 3: act on the decisions sequentially (deletes are rate-limited)
+            for (tweet, tweet_adapted, uploaded_media, _), (should_delete, reason, ai_analysis) in zip(pending, decisions):
+                decision, _ = await self._apply_decision(
+                    tweet_adapted, should_delete, reason, ai_analysis, uploaded_media, now=now_utc
+                )
+                if decision == "DELETE":
+                    deleted_count += 1
+                else:
+                    kept_count += 1
 
-                print()  # Blank line between tweets
+                logger.info("")  # Blank line between tweets
 
             # Summary
-            print("="*60)
-            print(f"✨ Summary for this run:")
-            print(f"   Analyzed: {analyzed_count}")
-            print(f"   Would delete: {deleted_count}")
-            print(f"   Keeping: {kept_count}")
+            logger.info("="*60)
+            logger.info(f"✨ Summary for this run:")
+            logger.info(f"   Analyzed: {analyzed_count}")
+            logger.info(f"   Would delete: {deleted_count}")
+            logger.info(f"   Keeping: {kept_count}")
             if not self.dry_run:
-                print(f"   Actually deleted: {deleted_count}")
-            print("="*60)
+                logger.info(f"   Actually deleted: {deleted_count}")
+            logger.info("="*60)
 
             # Update pagination token for next run
-            if response.meta and 'next_token' in response.meta:
-                next_token = response.meta['next_token']
-                self.state_manager.update_pagination_token(next_token)
-                print(f"\n📄 Pagination token saved - will continue from here next run")
-            else:
-                # No more pages, reset token
-                self.state_manager.update_pagination_token(None)
-                print(f"\n🏁 Reached end of tweets - will start from newest on next run")
+            self._update_pagination(response)
 
         except tweepy.errors.TweepyException as e:
-            print(f"❌ Twitter API Error: {e}")
+            logger.error(f"❌ Twitter API Error: {e}")
         finally:
-            # Save state to MongoDB
-            self.state_manager.save_state()
-            print(f"\n💾 Progress saved to MongoDB")
+            # Bulk-write buffered decisions and save state to MongoDB
+            self.state_manager.flush()
+            logger.info(f"\n💾 Progress saved to MongoDB")
+
+    async def run_batch_mode(self, limit=MAX_TWEETS_PER_RUN):
+        """
+        Batch-mode loop for non-urgent runs: analyses go through the OpenAI
+        Batch API (50% token cost, 24h completion window). If a batch is
+        pending from a previous run, process its results; otherwise submit
+        a new one. Rule-based and image tweets are still handled inline.
+        """
+        self._print_header()
+
+        batch_doc = self.state_manager.state_collection.find_one({"_id": "openai_batch"})
+
+        try:
+            if batch_doc:
+                await self._process_batch_results(batch_doc)
+            else:
+                await self._submit_analysis_batch(limit)
+        except tweepy.errors.TweepyException as e:
+            logger.error(f"❌ Twitter API Error: {e}")
+        finally:
+            self.state_manager.flush()
+            logger.info(f"\n💾 Progress saved to MongoDB")
+
+    async def _submit_analysis_batch(self, limit):
+        """Fetch a page of tweets, handle rule/image ones inline, batch the rest"""
+        response = self._fetch_tweets(limit)
+
+        if not response.data:
+            logger.info("✅ No more tweets to process!")
+            self.state_manager.update_pagination_token(None)
+            return
+
+        tweets = response.data
+        media_dict = {}
+        if response.includes and 'media' in response.includes:
+            media_dict = {m.media_key: m for m in response.includes['media']}
+
+        logger.info(f"📋 Found {len(tweets)} tweets to analyze\n")
+
+        now_utc = datetime.now(timezone.utc)
+        analyzed_ids = self.state_manager.preload_analyzed(tweet.id for tweet in tweets)
+        batch_tweets = []  # Docs persisted alongside the batch id
+        for tweet in tweets:
+            if str(tweet.id) in analyzed_ids:
+                logger.info("⏭️  Skipping already analyzed tweet %s", tweet.id)
+                continue
+
+            tweet_age = now_utc - tweet.created_at
+            if tweet_age.days < SKIP_RECENT_DAYS:
+                logger.info("⏭️  Skipping recent tweet %s (%s days old, waiting %s days)", tweet.id, tweet_age.days, SKIP_RECENT_DAYS)
+                continue
+
+            tweet_adapted = self._adapt_v2_tweet(tweet, media_dict)
+
+            # Rules first, so rule-driven deletes never touch the AI path
+            rule_decision = self.decider.rule_check(tweet_adapted)
+
+            uploaded_media = []
+            is_reply_to_other = tweet_adapted.in_reply_to_status_id and tweet_adapted.in_reply_to_user_id != self.my_user_id
+            if not is_reply_to_other:
+                media_items = self.decider._extract_all_media(tweet_adapted)
+                if media_items:
+                    logger.info("📸 Found %s media item(s) in tweet %s", len(media_items), tweet.id)
+                    uploaded_media = self._upload_tweet_media(tweet_adapted, media_items)
+
+            if rule_decision:
+                await self._apply_decision(tweet_adapted, *rule_decision, uploaded_media, now=now_utc)
+                logger.info("")
+                continue
+
+            # Vision inputs stay on the synchronous path (simpler than batching them)
+            image_urls = self.decider._extract_image_urls(tweet_adapted)
+            if image_urls:
+                analysis = await self.analyzer.analyze_tweet(tweet_adapted.full_text, image_urls)
+                await self._apply_decision(
+                    tweet_adapted, *self.decider.decide_from_analysis(analysis), uploaded_media,
+                    now=now_utc
+                )
+                logger.info("")
+                continue
+
+            batch_tweets.append({
+                "tweet_id": str(tweet.id),
+                "text": tweet_adapted.full_text,
+                "created_at": tweet_adapted.created_at.isoformat(),
+                "uploaded_media": uploaded_media
+            })
+
+        if not batch_tweets:
+            logger.info("✅ Nothing left to batch - all tweets handled inline")
+            self._update_pagination(response)
+            return
+
+        batch_id = await self.analyzer.submit_batch(
+            [(doc["tweet_id"], doc["text"]) for doc in batch_tweets]
+        )
+        self.state_manager.state_collection.replace_one(
+            {"_id": "openai_batch"},
+            {"_id": "openai_batch", "batch_id": batch_id, "tweets": batch_tweets,
+             "submitted_at": now_utc.isoformat()},
+            upsert=True
+        )
+        self._update_pagination(response)
+        logger.info(f"\n📦 Submitted batch {batch_id} with {len(batch_tweets)} tweets")
+        logger.info(f"   Run with --batch-mode again later to process the results")
+
+    async def _process_batch_results(self, batch_doc):
+        """Apply the decisions from a completed OpenAI batch"""
+        results = await self.analyzer.retrieve_batch_results(batch_doc["batch_id"])
+        if results is None:
+            return  # Still in progress - leave the batch doc for the next run
+
+        now_utc = datetime.now(timezone.utc)
+        deleted_count = 0
+        kept_count = 0
+        for doc in batch_doc["tweets"]:
+            analysis = results.get(doc["tweet_id"]) or self.analyzer._fallback_analysis(doc["text"])
+            tweet_record = BatchTweetRecord(doc)
+            decision, _ = await self._apply_decision(
+                tweet_record, *self.decider.decide_from_analysis(analysis),
+                doc.get("uploaded_media", []), now=now_utc
+            )
+            if decision == "DELETE":
+                deleted_count += 1
+            else:
+                kept_count += 1
+            logger.info("")
+
+        self.state_manager.state_collection.delete_one({"_id": "openai_batch"})
+
+        logger.info("="*60)
+        logger.info(f"✨ Batch {batch_doc['batch_id']} processed:")
+        logger.info(f"   Analyzed: {len(batch_doc['tweets'])}")
+        logger.info(f"   Would delete: {deleted_count}")
+        logger.info(f"   Keeping: {kept_count}")
+        logger.info("="*60)
 
     def _adapt_v2_tweet(self, tweet_v2, media_dict):
         """Convert v2 tweet format to v1-like structure for compatibility"""
-        class AdaptedTweet:
-            def __init__(self, v2_tweet, media_dict):
-                self.id = v2_tweet.id
-                self.full_text = v2_tweet.text
-                self.created_at = v2_tweet.created_at
-                self.in_reply_to_status_id = None
-                self.in_reply_to_user_id = getattr(v2_tweet, 'in_reply_to_user_id', None)
-
-                # Check for retweet
-                if hasattr(v2_tweet, 'referenced_tweets') and v2_tweet.referenced_tweets:
-                    for ref in v2_tweet.referenced_tweets:
-                        if ref.type == 'retweeted':
-                            self.retweeted_status = True
-                            break
-                        elif ref.type == 'replied_to':
-                            self.in_reply_to_status_id = ref.id
-
-                # Handle media
-                self.extended_entities = {}
-                if hasattr(v2_tweet, 'attachments') and v2_tweet.attachments and 'media_keys' in v2_tweet.attachments:
-                    media_list = []
-                    for media_key in v2_tweet.attachments['media_keys']:
-                        if media_key in media_dict:
-                            media_obj = media_dict[media_key]
-                            media_list.append({
-                                'type': media_obj.type,
-                                'media_url_https': getattr(media_obj, 'url', None)
-                            })
-                    if media_list:
-                        self.extended_entities['media'] = media_list
-
         return AdaptedTweet(tweet_v2, media_dict)
 
     def _download_media(self, url, timeout=30):
         """
-        Download media from URL
-        Returns: bytes or None if failed
+        Download media from URL (streamed, capped at MAX_MEDIA_BYTES)
+        Returns: BytesIO or None if failed
         """
         try:
-            response = requests.get(url, timeout=timeout)
-            if response.status_code == 200:
-                return response.content
-            else:
-                print(f"⚠️  Failed to download media: HTTP {response.status_code}")
-                return None
+            buf, _ = download_capped(url, MAX_MEDIA_BYTES, timeout=timeout)
+            return buf
         except Exception as e:
-            print(f"⚠️  Failed to download media from {url}: {e}")
+            logger.warning(f"⚠️  Failed to download media from {url}: {e}")
             return None
 
     def _upload_tweet_media(self, tweet, media_items):
@@ -594,16 +1133,18 @@ class TweetDeleter:
         uploaded_media = []
         tweet_id = tweet.id
 
-        for idx, media_item in enumerate(media_items):
-            media_type = media_item['type']
-            media_url = media_item['url']
+        # Download all media in parallel - each is an independent HTTP fetch
+        logger.info("📥 Downloading %s media item(s) from tweet %s...", len(media_items), tweet_id)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            downloads = list(executor.map(
+                lambda item: self._download_media(item['url']), media_items
+            ))
 
-            # Download media
-            print(f"📥 Downloading {media_type} {idx+1}/{len(media_items)} from tweet {tweet_id}...")
-            media_bytes = self._download_media(media_url)
+        for idx, (media_item, media_buf) in enumerate(zip(media_items, downloads)):
+            media_type = media_item['type']
 
-            if not media_bytes:
-                print(f"⚠️  Skipping upload - download failed")
+            if media_buf is None:
+                logger.warning(f"⚠️  Skipping upload - download failed")
                 continue
 
             # Determine file extension and content type
@@ -620,8 +1161,8 @@ class TweetDeleter:
 
             # Upload to R2
             try:
-                upload_result = self.storage.upload_bytes(
-                    media_bytes,
+                upload_result = self.storage.upload_stream(
+                    media_buf,
                     object_key,
                     content_type=content_type
                 )
@@ -634,10 +1175,10 @@ class TweetDeleter:
                     'file_size': upload_result['file_size']
                 })
 
-                print(f"✅ Uploaded {media_type} to: {upload_result['object_path']}")
+                logger.info("✅ Uploaded %s to: %s", media_type, upload_result['object_path'])
 
             except StorageUploadError as e:
-                print(f"❌ Failed to upload {media_type}: {e}")
+                logger.error(f"❌ Failed to upload {media_type}: {e}")
                 continue
 
         return uploaded_media
@@ -661,11 +1202,16 @@ def main():
         action='store_true',
         help='Reset pagination and start from newest tweets'
     )
+    parser.add_argument(
+        '--batch-mode',
+        action='store_true',
+        help='Use the OpenAI Batch API (50%% cheaper, results within 24h)'
+    )
 
     args = parser.parse_args()
 
     if not OPENAI_API_KEY:
-        print("❌ Error: OPENAI_API_KEY not found in .env file")
+        logger.error("❌ Error: OPENAI_API_KEY not found in .env file")
         return
 
     # Reset pagination if requested
@@ -675,22 +1221,25 @@ def main():
             {"$set": {"pagination_token": None}},
             upsert=True
         )
-        print("✅ Pagination reset - will start from newest tweets\n")
+        logger.info("✅ Pagination reset - will start from newest tweets\n")
 
     if not args.execute:
-        print("\n⚠️  DRY RUN MODE - No tweets will be deleted")
-        print("   Use --execute to actually delete tweets\n")
+        logger.info("\n⚠️  DRY RUN MODE - No tweets will be deleted")
+        logger.info("   Use --execute to actually delete tweets\n")
 
     deleter = TweetDeleter(dry_run=not args.execute)
-    deleter.run(limit=args.limit)
+    if args.batch_mode:
+        asyncio.run(deleter.run_batch_mode(limit=args.limit))
+    else:
+        asyncio.run(deleter.run(limit=args.limit))
 
-    print("\n" + "="*60)
+    logger.info("\n" + "="*60)
     if args.execute:
-        print("✨ Done! Run again to process more tweets.")
+        logger.info("✨ Done! Run again to process more tweets.")
     else:
-        print("✨ Dry run complete! Review decisions in MongoDB")
-        print("   Run with --execute to actually delete tweets")
-    print("="*60)
+        logger.info("✨ Dry run complete! Review decisions in MongoDB")
+        logger.info("   Run with --execute to actually delete tweets")
+    logger.info("="*60)
 
 
 if __name__ == "__main__":
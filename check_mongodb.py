@@ -35,7 +35,9 @@ try:
     print("📋 RECENT DECISIONS:")
     print("="*60)
     decisions = list(decisions_collection.find().sort("analyzed_at", -1).limit(5))
-    print(f"Total decisions in DB: {decisions_collection.count_documents({})}")
+    # estimated_document_count reads collection metadata (O(1)) instead of
+    # scanning every document like count_documents({})
+    print(f"Total decisions in DB: {decisions_collection.estimated_document_count()}")
     print(f"\nShowing last 5 decisions:\n")
 
     for i, decision in enumerate(decisions, 1):
@@ -2,6 +2,8 @@
 Clear test data from MongoDB to test pagination from scratch
 """
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
 from pymongo import MongoClient
 
@@ -9,16 +11,29 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASEURL")
 
+
+@lru_cache(maxsize=1)
+def get_client():
+    """Process-wide MongoClient so importers share one connection pool."""
+    return MongoClient(
+        DATABASE_URL,
+        maxPoolSize=50,
+        serverSelectionTimeoutMS=2000,
+        retryWrites=True,
+    )
+
+
 try:
-    client = MongoClient(DATABASE_URL)
+    client = get_client()
     db = client.get_default_database()
 
     state_collection = db["state"]
     decisions_collection = db["decisions"]
 
-    # Clear all data
-    decisions_collection.delete_many({})
-    state_collection.delete_many({})
+    # Clear all data - drop() is a server-side metadata operation instead of
+    # the per-document scan delete_many({}) does
+    decisions_collection.drop()
+    state_collection.drop()
 
     print("✅ Cleared all test data from MongoDB")
     print("   Ready to test pagination from scratch")
@@ -0,0 +1,29 @@
+"""
+Quick check that Twitter credentials are set and working
+"""
+import os
+import sys
+from dotenv import load_dotenv
+import tweepy
+
+load_dotenv()
+
+# One dict walk and one stdout write instead of four getenv + print pairs
+creds = {k: os.getenv(k) for k in ("API_KEY", "API_SECRET", "ACCESS_TOKEN", "ACCESS_TOKEN_SECRET")}
+sys.stdout.write(
+    "\n".join(f"{k}: {(v[:10] + '...') if v else 'NOT SET'}" for k, v in creds.items()) + "\n"
+)
+
+try:
+    client = tweepy.Client(
+        bearer_token=os.getenv("BEARER_TOKEN"),
+        consumer_key=creds["API_KEY"],
+        consumer_secret=creds["API_SECRET"],
+        access_token=creds["ACCESS_TOKEN"],
+        access_token_secret=creds["ACCESS_TOKEN_SECRET"],
+    )
+    me = client.get_me()
+    print(f"✅ Authenticated as @{me.data.username}")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
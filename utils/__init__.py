@@ -0,0 +1,16 @@
+"""
+Utility modules.
+"""
+from .storage_manager import (
+    CloudflareR2Storage,
+    StorageError,
+    StorageUploadError,
+    generate_object_key,
+)
+
+__all__ = [
+    "CloudflareR2Storage",
+    "StorageError",
+    "StorageUploadError",
+    "generate_object_key",
+]